@@ -1,7 +1,10 @@
 from typing import Optional
 from redis import Redis
+from redis.asyncio import Redis as AsyncRedis
 import secrets
 from ..core.redis_client import get_redis
+from ..core.config import settings
+from .session_cache import get_session_cache
 
 def _session_ttl_seconds() -> int:
     return 60 * 60 * 24 * 7  # 7 days
@@ -22,14 +25,49 @@ def get_current_user_id(r: Redis, sid: Optional[str]) -> Optional[int]:
 
 def destroy_session(sid: str, r: Redis) -> None:
     r.delete(f"sess:{sid}")
+    cache = get_session_cache()
+    if cache is not None:
+        cache.invalidate(sid)
+        r.publish(settings.SESSION_CACHE_CHANNEL, sid)
+
+# --- async variants (redis.asyncio) used by the routes ---
+async def create_session_async(user_id: int, *, r: AsyncRedis) -> str:
+    """Async create_session: store the session and return sid."""
+    sid = secrets.token_urlsafe(32)
+    await r.setex(f"sess:{sid}", _session_ttl_seconds(), str(user_id))
+    return sid
+
+async def get_current_user_id_async(r: AsyncRedis, sid: Optional[str]) -> Optional[int]:
+    """Async get_current_user_id: user id from sid, or None."""
+    if not sid:
+        return None
+    cache = get_session_cache()
+    if cache is not None:
+        uid = cache.get(sid)
+        if uid is not None:
+            return uid
+    val = await r.get(f"sess:{sid}")
+    if val is None:
+        return None
+    if cache is not None:
+        cache.set(sid, int(val))
+    return int(val)
+
+async def destroy_session_async(sid: str, r: AsyncRedis) -> None:
+    await r.delete(f"sess:{sid}")
+    cache = get_session_cache()
+    if cache is not None:
+        # drop it here right away, then tell the other workers
+        cache.invalidate(sid)
+        await r.publish(settings.SESSION_CACHE_CHANNEL, sid)
 
 # Optional: dependency factory for protected routes
 from fastapi import Depends, HTTPException, Request
-from app.core.redis_client import get_redis
+from app.core.redis_client import get_async_redis
 
 def require_auth():
-    def _dep(req: Request, r: Redis = Depends(get_redis)) -> int:
-        uid = get_current_user_id(r, req.cookies.get("sid"))
+    async def _dep(req: Request, r: AsyncRedis = Depends(get_async_redis)) -> int:
+        uid = await get_current_user_id_async(r, req.cookies.get("sid"))
         if not uid:
             raise HTTPException(status_code=401)
         return uid
@@ -0,0 +1,144 @@
+# app/auth/session_cache.py
+from __future__ import annotations
+
+import asyncio
+import threading
+import time
+from collections import OrderedDict
+from typing import Callable, Optional
+
+from fastapi import logger
+from redis.asyncio import Redis as AsyncRedis
+
+from ..core.config import settings
+
+
+class SessionCache:
+    """
+    Bounded, per-worker TTL/LRU cache of sid -> user_id.
+
+    Entries live at most `ttl_seconds`, which bounds how long a logout can go
+    unnoticed on a worker that missed the pub/sub invalidation.
+    """
+
+    def __init__(
+        self,
+        max_entries: int,
+        ttl_seconds: float,
+        *,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self.max_entries = max_entries
+        self.ttl_seconds = ttl_seconds
+        self._clock = clock
+        self._data: "OrderedDict[str, tuple[int, float]]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.expirations = 0
+        self.invalidations = 0
+
+    def get(self, sid: str) -> Optional[int]:
+        with self._lock:
+            entry = self._data.get(sid)
+            if entry is None:
+                self.misses += 1
+                return None
+            uid, expires_at = entry
+            if expires_at <= self._clock():
+                del self._data[sid]
+                self.expirations += 1
+                self.misses += 1
+                return None
+            self._data.move_to_end(sid)
+            self.hits += 1
+            return uid
+
+    def set(self, sid: str, user_id: int) -> None:
+        with self._lock:
+            self._data[sid] = (user_id, self._clock() + self.ttl_seconds)
+            self._data.move_to_end(sid)
+            while len(self._data) > self.max_entries:
+                self._data.popitem(last=False)
+                self.evictions += 1
+
+    def invalidate(self, sid: str) -> None:
+        with self._lock:
+            if self._data.pop(sid, None) is not None:
+                self.invalidations += 1
+
+    def clear(self) -> None:
+        with self._lock:
+            self._data.clear()
+
+    def stats(self) -> dict:
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "size": len(self._data),
+                "max_entries": self.max_entries,
+                "ttl_seconds": self.ttl_seconds,
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_ratio": (self.hits / lookups) if lookups else 0.0,
+                "evictions": self.evictions,
+                "expirations": self.expirations,
+                "invalidations": self.invalidations,
+            }
+
+
+def _build_cache() -> Optional[SessionCache]:
+    if not settings.SESSION_CACHE_ENABLED:
+        return None
+    return SessionCache(settings.SESSION_CACHE_MAX_ENTRIES, settings.SESSION_CACHE_TTL_SECONDS)
+
+
+_cache: Optional[SessionCache] = _build_cache()
+
+
+def get_session_cache() -> Optional[SessionCache]:
+    """Return this worker's session cache, or None when caching is disabled."""
+    return _cache
+
+
+def set_session_cache(cache: Optional[SessionCache]) -> None:
+    """Swap the worker's cache (tests / app startup)."""
+    global _cache
+    _cache = cache
+
+
+async def run_invalidation_listener(
+    r: AsyncRedis,
+    cache: SessionCache,
+    *,
+    channel: str | None = None,
+    retry_delay: float = 1.0,
+) -> None:
+    """
+    Subscribe to the invalidation channel and drop sids published by
+    destroy_session on any worker. Runs until cancelled; reconnects on error.
+    """
+    channel = channel or settings.SESSION_CACHE_CHANNEL
+    while True:
+        pubsub = r.pubsub(ignore_subscribe_messages=True)
+        try:
+            await pubsub.subscribe(channel)
+            # anything published while we were not subscribed is lost
+            cache.clear()
+            async for msg in pubsub.listen():
+                if msg.get("type") == "message":
+                    data = msg["data"]
+                    if isinstance(data, bytes):
+                        data = data.decode("utf-8", errors="replace")
+                    cache.invalidate(data)
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            logger.logger.warning("[SESSION-CACHE] invalidation listener error: %s", e)
+            await asyncio.sleep(retry_delay)
+        finally:
+            try:
+                await pubsub.aclose()
+            except Exception:
+                pass
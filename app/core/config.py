@@ -23,4 +23,10 @@ class Settings(BaseSettings):
     MAGIC_TOKEN_TTL: int = int(os.getenv("MAGIC_TOKEN_TTL", "900"))
     SESSION_TTL_DAYS: int = int(os.getenv("SESSION_TTL_DAYS", "30"))
 
+    # per-worker sid -> user_id cache (invalidated over Redis pub/sub)
+    SESSION_CACHE_ENABLED: bool = os.getenv("SESSION_CACHE_ENABLED", "false").lower() == "true"
+    SESSION_CACHE_MAX_ENTRIES: int = int(os.getenv("SESSION_CACHE_MAX_ENTRIES", "10000"))
+    SESSION_CACHE_TTL_SECONDS: float = float(os.getenv("SESSION_CACHE_TTL_SECONDS", "5"))
+    SESSION_CACHE_CHANNEL: str = os.getenv("SESSION_CACHE_CHANNEL", "sess:invalidate")
+
 settings = Settings()
@@ -4,17 +4,24 @@ from __future__ import annotations
 from typing import Optional
 from functools import lru_cache
 from redis import Redis
+from redis.asyncio import Redis as AsyncRedis
 from .config import settings
 
 # --- test override hook (what your test expects) ---
 # tests can set this to a FakeRedis; if None, we build a client lazily.
 redis_client: Optional[Redis] = None
+async_redis_client: Optional[AsyncRedis] = None
 
 @lru_cache(maxsize=1)
 def _build_client() -> Redis:
     # construct from env once (cached)
     return Redis.from_url(settings.REDIS_URL, decode_responses=True)
 
+@lru_cache(maxsize=1)
+def _build_async_client() -> AsyncRedis:
+    # native asyncio client; one per worker process (one event loop)
+    return AsyncRedis.from_url(settings.REDIS_URL, decode_responses=True)
+
 def get_redis() -> Redis:
     """
     FastAPI dependency. Returns the test override if provided, otherwise
@@ -24,6 +31,16 @@ def get_redis() -> Redis:
         return redis_client
     return _build_client()
 
+async def get_async_redis() -> AsyncRedis:
+    """
+    Async FastAPI dependency. Same contract as get_redis, but hands out a
+    redis.asyncio client so routes can await Redis on the event loop instead
+    of occupying a threadpool slot.
+    """
+    if async_redis_client is not None:
+        return async_redis_client
+    return _build_async_client()
+
 # (optional) small helper for tests / app startup
 def set_redis_override(client: Optional[Redis]) -> None:
     """Set or clear the test/client override and clear cache when clearing."""
@@ -31,3 +48,10 @@ def set_redis_override(client: Optional[Redis]) -> None:
     redis_client = client
     if client is None:
         _build_client.cache_clear()  # ensure next call rebuilds from env
+
+def set_async_redis_override(client: Optional[AsyncRedis]) -> None:
+    """Async counterpart of set_redis_override."""
+    global async_redis_client
+    async_redis_client = client
+    if client is None:
+        _build_async_client.cache_clear()
@@ -1,5 +1,7 @@
 # app/db.py
 from sqlalchemy import create_engine
+from sqlalchemy.engine import make_url
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
 from sqlalchemy.orm import sessionmaker
 from .core.config import settings
 
@@ -20,3 +22,28 @@ def get_db():
         yield db
     finally:
         db.close()
+
+
+# --- async engine (used by the async routes) ---
+def async_database_url(url: str) -> str:
+    """Map a sync DATABASE_URL onto the matching async driver."""
+    u = make_url(url)
+    backend = u.get_backend_name()
+    if backend == "postgresql":
+        u = u.set(drivername="postgresql+psycopg")  # psycopg 3 speaks asyncio natively
+    elif backend == "sqlite":
+        u = u.set(drivername="sqlite+aiosqlite")
+    return u.render_as_string(hide_password=False)
+
+
+async_engine = create_async_engine(
+    async_database_url(settings.DATABASE_URL),
+    pool_pre_ping=True,
+)
+
+# expire_on_commit=False: attributes stay loaded after commit (no implicit IO)
+AsyncSessionLocal = async_sessionmaker(bind=async_engine, autoflush=False, expire_on_commit=False)
+
+async def get_async_db():
+    async with AsyncSessionLocal() as db:
+        yield db
@@ -1,13 +1,35 @@
 # app/main.py
+import asyncio
+import contextlib
 import urllib.parse
+from contextlib import asynccontextmanager
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 from .db import engine
 from .models import Base
 
 from .core.config import settings
+from .core.redis_client import get_async_redis
+from .auth.session_cache import get_session_cache, run_invalidation_listener
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    # per-worker background tasks; cancelled on shutdown
+    tasks: list[asyncio.Task] = []
+    cache = get_session_cache()
+    if cache is not None:
+        tasks.append(asyncio.create_task(run_invalidation_listener(await get_async_redis(), cache)))
+    yield
+    for t in tasks:
+        t.cancel()
+    for t in tasks:
+        with contextlib.suppress(asyncio.CancelledError):
+            await t
+
 
 app = FastAPI(
+    lifespan=lifespan,
     title="Five Eyes API",
     version="1.0.0",
     description="Endpoints for auth, health checks, etc.",
@@ -5,10 +5,10 @@ import secrets
 from fastapi import APIRouter, Depends, Response, Request, BackgroundTasks, HTTPException, status
 from fastapi.responses import RedirectResponse, JSONResponse
 from sqlalchemy import select
-from sqlalchemy.orm import Session
-from redis import Redis
+from sqlalchemy.ext.asyncio import AsyncSession
+from redis.asyncio import Redis as AsyncRedis
 
-from ..db import get_db
+from ..db import get_async_db
 from ..models.user import User
 from ..schemas.auth import (
     EmailRequest,
@@ -19,8 +19,8 @@ from ..schemas.auth import (
     LogoutResponse,
     CallbackOK,        # <-- NEW
 )
-from ..core.redis_client import get_redis
-from ..auth.session import create_session, destroy_session
+from ..core.redis_client import get_async_redis
+from ..auth.session import create_session_async, destroy_session_async
 from ..core.config import settings
 from ..core.emailer import send_email
 from ..auth.deps import current_user_id
@@ -37,22 +37,22 @@ router = APIRouter(prefix="/api/auth", tags=["Auth"])
         422: {"description": "Validation error"},
     },
 )
-def request_link(
+async def request_link(
     payload: EmailRequest,
     background: BackgroundTasks,
-    db: Session = Depends(get_db),
-    r: Redis = Depends(get_redis),
+    db: AsyncSession = Depends(get_async_db),
+    r: AsyncRedis = Depends(get_async_redis),
 ) -> MagicLinkResponse:
     email = payload.email.strip().lower()
-    user = db.scalar(select(User).where(User.email == email))
+    user = await db.scalar(select(User).where(User.email == email))
     if not user:
         user = User(email=email)
         db.add(user)
-        db.commit()
-        db.refresh(user)
+        await db.commit()
+        await db.refresh(user)
 
     token = secrets.token_urlsafe(32)
-    r.setex(f"magic:{token}", settings.MAGIC_TOKEN_TTL, str(user.id))
+    await r.setex(f"magic:{token}", settings.MAGIC_TOKEN_TTL, str(user.id))
 
     link = f"{settings.BACKEND_PUBLIC_URL}/api/auth/callback?token={token}"
     background.add_task(
@@ -86,15 +86,15 @@ def request_link(
         400: {"model": ErrorResponse, "description": "Invalid or expired token"},
     },
 )
-def callback(token: str, request: Request, r: Redis = Depends(get_redis)):
-    user_id = r.get(f"magic:{token}")
+async def callback(token: str, request: Request, r: AsyncRedis = Depends(get_async_redis)):
+    user_id = await r.get(f"magic:{token}")
     if not user_id:
         # make 400 appear with a modeled body
         raise HTTPException(status_code=400, detail="invalid or expired token")
 
-    r.delete(f"magic:{token}")
+    await r.delete(f"magic:{token}")
 
-    sid = create_session(int(user_id), r=r)
+    sid = await create_session_async(int(user_id), r=r)
 
     # Decide `secure` at request time
     env_name = (getenv("ENV_NAME", settings.ENV_NAME) or "").lower()
@@ -138,8 +138,8 @@ def callback(token: str, request: Request, r: Redis = Depends(get_redis)):
         401: {"model": ErrorResponse, "description": "Unauthorized"},
     },
 )
-def me(user_id: int = Depends(current_user_id), db: Session = Depends(get_db)) -> MeResponse:
-    user = db.get(User, user_id)
+async def me(user_id: int = Depends(current_user_id), db: AsyncSession = Depends(get_async_db)) -> MeResponse:
+    user = await db.get(User, user_id)
     if not user:
         return MeResponse(user=None)
     return MeResponse(user=MeUser(id=user.id, email=user.email, role_id=user.role_id))
@@ -152,13 +152,13 @@ def me(user_id: int = Depends(current_user_id), db: Session = Depends(get_db)) -
         200: {"model": LogoutResponse, "description": "Logged out and cookie cleared"},
     },
 )
-def logout(
+async def logout(
     request: Request,
     response: Response,
-    r: Redis = Depends(get_redis),
+    r: AsyncRedis = Depends(get_async_redis),
 ) -> LogoutResponse:
     sid = request.cookies.get("sid")
     if sid:
-        destroy_session(sid, r=r)
+        await destroy_session_async(sid, r=r)
     response.delete_cookie(key="sid", path="/")
     return LogoutResponse(ok=True)
@@ -5,7 +5,14 @@ from redis import Redis
 
 from ..db import engine
 from ..core.redis_client import get_redis
-from ..schemas.health import HealthResponse, RedisPingResponse, DBVersionResponse, ErrorResponse
+from ..schemas.health import (
+    HealthResponse,
+    RedisPingResponse,
+    DBVersionResponse,
+    ErrorResponse,
+    SessionCacheStatsResponse,
+)
+from ..auth.session_cache import get_session_cache
 from fastapi.responses import JSONResponse
 from fastapi import status
 
@@ -58,3 +65,18 @@ def db_version():
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             content=ErrorResponse(error=str(e)).model_dump(),
         )
+
+
+@router.get(
+    "/session-cache",
+    summary="Session cache counters",
+    response_model=SessionCacheStatsResponse,
+    responses={
+        200: {"model": SessionCacheStatsResponse, "description": "Per-worker sid cache hit/miss/eviction counters"},
+    },
+)
+def session_cache_stats() -> SessionCacheStatsResponse:
+    cache = get_session_cache()
+    if cache is None:
+        return SessionCacheStatsResponse(enabled=False)
+    return SessionCacheStatsResponse(enabled=True, stats=cache.stats())
@@ -18,5 +18,5 @@ RequireAuth = require_auth()
         401: {"model": ErrorResponse, "description": "Unauthorized"},
     },
 )
-def whoami(user_id: int = Depends(RequireAuth)) -> WhoAmIResponse:
+async def whoami(user_id: int = Depends(RequireAuth)) -> WhoAmIResponse:
     return WhoAmIResponse(user_id=user_id)
@@ -12,7 +12,9 @@ from .health import (
     HealthResponse, 
     RedisPingResponse,
     DBVersionResponse,
-    ErrorResponse
+    ErrorResponse,
+    SessionCacheStats,
+    SessionCacheStatsResponse,
 )
 from .protected import (
     WhoAmIResponse
@@ -30,5 +32,7 @@ __all__ = [
     "RedisPingResponse",
     "DBVersionResponse",
     "ErrorResponse",
+    "SessionCacheStats",
+    "SessionCacheStatsResponse",
     "WhoAmIResponse",
 ]
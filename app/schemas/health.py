@@ -1,4 +1,5 @@
 from pydantic import BaseModel
+from typing import Optional
 
 class HealthResponse(BaseModel):
     ok: bool
@@ -11,3 +12,18 @@ class DBVersionResponse(BaseModel):
 
 class ErrorResponse(BaseModel):
     error: str
+
+class SessionCacheStats(BaseModel):
+    size: int
+    max_entries: int
+    ttl_seconds: float
+    hits: int
+    misses: int
+    hit_ratio: float
+    evictions: int
+    expirations: int
+    invalidations: int
+
+class SessionCacheStatsResponse(BaseModel):
+    enabled: bool
+    stats: Optional[SessionCacheStats] = None
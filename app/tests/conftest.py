@@ -28,24 +28,36 @@ os.environ["SESSION_TTL_DAYS"] = "1"
 os.environ["ENV_NAME"] = "test"
 
 from app.main import app
-from app.db import get_db
+from app.db import get_db, get_async_db
 from app.models import Base
-from app.core.redis_client import get_redis
+from app.core.redis_client import get_redis, get_async_redis
 from fastapi.testclient import TestClient
 
 # --- DB setup for tests (SQLite in-memory shared) ---
 from sqlalchemy.pool import StaticPool
+from sqlalchemy.ext.asyncio import create_async_engine, async_sessionmaker
 
 os.environ["DATABASE_URL"] = "sqlite+pysqlite:///:memory:"
 
+# Named shared-cache memory DB so the sync (pysqlite) and async (aiosqlite)
+# engines see the same tables and rows.
+_TEST_DB = "file:app_tests?mode=memory&cache=shared&uri=true"
+
 TEST_ENGINE = create_engine(
-    os.environ["DATABASE_URL"],
+    f"sqlite+pysqlite:///{_TEST_DB}",
     connect_args={"check_same_thread": False},
     poolclass=StaticPool,         # ← single shared in-memory DB
     future=True,
 )
 TestingSessionLocal = sessionmaker(bind=TEST_ENGINE, autoflush=False, autocommit=False, future=True)
 
+TEST_ASYNC_ENGINE = create_async_engine(
+    f"sqlite+aiosqlite:///{_TEST_DB}",
+    connect_args={"check_same_thread": False},
+    poolclass=StaticPool,
+)
+TestingAsyncSessionLocal = async_sessionmaker(bind=TEST_ASYNC_ENGINE, autoflush=False, expire_on_commit=False)
+
 @pytest.fixture(scope="session", autouse=True)
 def _create_tables():
     Base.metadata.create_all(bind=TEST_ENGINE)
@@ -56,6 +68,14 @@ def _create_tables():
 def db_session_factory():
     return TestingSessionLocal
 
+@pytest.fixture
+def async_db_session_factory():
+    return TestingAsyncSessionLocal
+
+async def _get_async_db():
+    async with TestingAsyncSessionLocal() as db:
+        yield db
+
 @pytest.fixture(autouse=True)
 def _override_db_dep():
     def _get_db():
@@ -65,27 +85,43 @@ def _override_db_dep():
         finally:
             db.close()
     app.dependency_overrides[get_db] = _get_db
+    app.dependency_overrides[get_async_db] = _get_async_db
     yield
     app.dependency_overrides.pop(get_db, None)
+    app.dependency_overrides.pop(get_async_db, None)
 
 # --- Redis override ---
 @pytest.fixture(scope="session")
-def fake_redis():
+def fake_redis_server():
+    import fakeredis
+    return fakeredis.FakeServer()
+
+@pytest.fixture(scope="session")
+def fake_redis(fake_redis_server):
     import fakeredis
-    return fakeredis.FakeRedis(decode_responses=True)
+    return fakeredis.FakeRedis(server=fake_redis_server, decode_responses=True)
+
+@pytest.fixture
+def fake_async_redis(fake_redis_server):
+    # asyncio clients are bound to the loop they first run on, and TestClient
+    # may spin up a fresh loop per request, so hand out a new client each time
+    # (all of them share the same data as `fake_redis`).
+    import fakeredis.aioredis
+    return lambda: fakeredis.aioredis.FakeRedis(server=fake_redis_server, decode_responses=True)
 
 @pytest.fixture(autouse=True)
-def _override_redis(fake_redis):
+def _override_redis(fake_redis, fake_async_redis):
     app.dependency_overrides[get_redis] = lambda: fake_redis
+    app.dependency_overrides[get_async_redis] = fake_async_redis
     yield
     app.dependency_overrides.pop(get_redis, None)
+    app.dependency_overrides.pop(get_async_redis, None)
 
 
 @pytest.fixture
-def client(fake_redis, db_session_factory):
+def client(fake_redis, fake_async_redis, db_session_factory):
     from app.db import get_db
-    from app.core.redis_client import get_redis
-    from app.auth import deps as auth_deps
+    from app.core.redis_client import get_redis, get_async_redis
     from fastapi.testclient import TestClient
     from app.main import app
 
@@ -98,19 +134,21 @@ def client(fake_redis, db_session_factory):
             db.close()
 
     app.dependency_overrides[get_db] = _get_db
+    app.dependency_overrides[get_async_db] = _get_async_db
 
     # --- Redis overrides (belt & suspenders) ---
-    # Some routes import get_redis from core, others via auth.deps.
+    # Sync routes use get_redis, async routes/auth deps use get_async_redis.
     app.dependency_overrides[get_redis] = lambda: fake_redis
-    app.dependency_overrides[auth_deps.get_redis] = lambda: fake_redis
+    app.dependency_overrides[get_async_redis] = fake_async_redis
 
     with TestClient(app) as c:
         yield c
 
     # clean up
     app.dependency_overrides.pop(get_db, None)
+    app.dependency_overrides.pop(get_async_db, None)
     app.dependency_overrides.pop(get_redis, None)
-    app.dependency_overrides.pop(auth_deps.get_redis, None)
+    app.dependency_overrides.pop(get_async_redis, None)
 
 # Helper to create a user and set sid cookie in the TestClient
 @pytest.fixture()
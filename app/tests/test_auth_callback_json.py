@@ -1,13 +1,15 @@
 # tests/test_auth_callback_json.py
 import fakeredis
+import fakeredis.aioredis
 from fastapi.testclient import TestClient
 from app.main import app
-from app.core.redis_client import get_redis
+from app.core.redis_client import get_async_redis
 
 def _seed_token(token: str, user_id: str = "1"):
-    r = fakeredis.FakeRedis(decode_responses=True)
+    server = fakeredis.FakeServer()
+    r = fakeredis.FakeRedis(server=server, decode_responses=True)
     r.setex(f"magic:{token}", 900, user_id)
-    app.dependency_overrides[get_redis] = lambda: r
+    app.dependency_overrides[get_async_redis] = lambda: fakeredis.aioredis.FakeRedis(server=server, decode_responses=True)
     return r
 
 def test_callback_json_via_accept_header(monkeypatch):
@@ -24,7 +26,7 @@ def test_callback_json_via_accept_header(monkeypatch):
     assert body["ok"] is True and "next" in body
     assert "sid=" in resp.headers.get("set-cookie", "")
 
-    app.dependency_overrides.pop(get_redis, None)
+    app.dependency_overrides.pop(get_async_redis, None)
 
 def test_callback_json_via_query_flag(monkeypatch):
     _seed_token("tok_json_flag")
@@ -37,5 +39,5 @@ def test_callback_json_via_query_flag(monkeypatch):
     assert body["ok"] is True and "next" in body
     assert "sid=" in resp.headers.get("set-cookie", "")
 
-    app.dependency_overrides.pop(get_redis, None)
+    app.dependency_overrides.pop(get_async_redis, None)
 
@@ -1,26 +1,27 @@
 # app/tests/test_auth_routes_branches.py
 import os
 import fakeredis
+import fakeredis.aioredis
 from fastapi.testclient import TestClient
 from app.main import app
-from app.core.redis_client import get_redis
-from app.db import get_db
+from app.core.redis_client import get_async_redis
+from app.db import get_async_db
 from app.auth.deps import current_user_id
 from app.models import User
 
 def test_callback_invalid_token_returns_400(monkeypatch):
-    app.dependency_overrides[get_redis] = lambda: fakeredis.FakeRedis(decode_responses=True)
+    app.dependency_overrides[get_async_redis] = lambda: fakeredis.aioredis.FakeRedis(decode_responses=True)
     try:
         res = TestClient(app).get("/api/auth/callback?token=doesnotexist")
         assert res.status_code == 400
         assert {'detail': 'invalid or expired token'} == res.json()
     finally:
-        app.dependency_overrides.pop(get_redis, None)
+        app.dependency_overrides.pop(get_async_redis, None)
 
 def test_callback_sets_secure_cookie_in_prod_env(monkeypatch):
-    r = fakeredis.FakeRedis(decode_responses=True)
-    r.setex("magic:tok", 900, "123")
-    app.dependency_overrides[get_redis] = lambda: r
+    server = fakeredis.FakeServer()
+    fakeredis.FakeRedis(server=server, decode_responses=True).setex("magic:tok", 900, "123")
+    app.dependency_overrides[get_async_redis] = lambda: fakeredis.aioredis.FakeRedis(server=server, decode_responses=True)
     # force non-test env to exercise secure=True branch
     monkeypatch.setenv("ENV_NAME", "prod")
     try:
@@ -32,18 +33,18 @@ def test_callback_sets_secure_cookie_in_prod_env(monkeypatch):
         assert "sid=" in cookie_header
         assert "Secure" in cookie_header
     finally:
-        app.dependency_overrides.pop(get_redis, None)
+        app.dependency_overrides.pop(get_async_redis, None)
         monkeypatch.setenv("ENV_NAME", "test")
 
 def test_me_returns_none_when_no_user_id(monkeypatch):
     """When current_user_id dependency yields None, /api/auth/me should return {'user': None}"""
-    # Override redis so auth dependency works
-    app.dependency_overrides[get_redis] = lambda: fakeredis.FakeRedis(decode_responses=True)
+    # Override async redis so auth dependency works
+    app.dependency_overrides[get_async_redis] = lambda: fakeredis.aioredis.FakeRedis(decode_responses=True)
 
-    # Override get_db so we don’t need a real DB
-    def _fake_db():
+    # Override get_async_db so we don’t need a real DB
+    async def _fake_db():
         yield None
-    app.dependency_overrides[get_db] = _fake_db
+    app.dependency_overrides[get_async_db] = _fake_db
 
     try:
         client = TestClient(app)
@@ -54,21 +55,21 @@ def test_me_returns_none_when_no_user_id(monkeypatch):
         assert res.status_code == 401
         assert res.json() == {'detail': 'Unauthorized'}
     finally:
-        app.dependency_overrides.pop(get_db, None)
-        app.dependency_overrides.pop(get_redis, None)
+        app.dependency_overrides.pop(get_async_db, None)
+        app.dependency_overrides.pop(get_async_redis, None)
 
 class FakeSession:
-    def get(self, model, pk):
+    async def get(self, model, pk):
         assert model is User
         return None  # simulate "user was deleted / not found"
 
-def _fake_db():
+async def _fake_db():
     yield FakeSession()
 
 def test_me_branch_user_not_found():
     # Override deps to hit the branch inside `me`
     app.dependency_overrides[current_user_id] = lambda: 999
-    app.dependency_overrides[get_db] = _fake_db
+    app.dependency_overrides[get_async_db] = _fake_db
     try:
         client = TestClient(app)
         resp = client.get("/api/auth/me")
@@ -76,4 +77,4 @@ def test_me_branch_user_not_found():
         assert resp.json() == {"user": None}
     finally:
         app.dependency_overrides.pop(current_user_id, None)
-        app.dependency_overrides.pop(get_db, None)
+        app.dependency_overrides.pop(get_async_db, None)
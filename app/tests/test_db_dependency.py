@@ -3,23 +3,24 @@ from app.db import get_db
 # app/tests/test_auth_routes_branches.py
 import os
 import fakeredis
+import fakeredis.aioredis
 from fastapi.testclient import TestClient
 from app.main import app
-from app.core.redis_client import get_redis
+from app.core.redis_client import get_async_redis
 
 def test_callback_invalid_token_returns_400(monkeypatch):
-    app.dependency_overrides[get_redis] = lambda: fakeredis.FakeRedis(decode_responses=True)
+    app.dependency_overrides[get_async_redis] = lambda: fakeredis.aioredis.FakeRedis(decode_responses=True)
     try:
         res = TestClient(app).get("/api/auth/callback?token=doesnotexist")
         assert res.status_code == 400
         assert {'detail': 'invalid or expired token'} == res.json()
     finally:
-        app.dependency_overrides.pop(get_redis, None)
+        app.dependency_overrides.pop(get_async_redis, None)
 
 def test_callback_sets_secure_cookie_in_prod_env(monkeypatch):
-    r = fakeredis.FakeRedis(decode_responses=True)
-    r.setex("magic:tok", 900, "123")
-    app.dependency_overrides[get_redis] = lambda: r
+    server = fakeredis.FakeServer()
+    fakeredis.FakeRedis(server=server, decode_responses=True).setex("magic:tok", 900, "123")
+    app.dependency_overrides[get_async_redis] = lambda: fakeredis.aioredis.FakeRedis(server=server, decode_responses=True)
     # force non-test env to exercise secure=True branch
     monkeypatch.setenv("ENV_NAME", "prod")
     try:
@@ -31,7 +32,7 @@ def test_callback_sets_secure_cookie_in_prod_env(monkeypatch):
         assert "sid=" in cookie_header
         assert "Secure" in cookie_header
     finally:
-        app.dependency_overrides.pop(get_redis, None)
+        app.dependency_overrides.pop(get_async_redis, None)
         monkeypatch.setenv("ENV_NAME", "test")
 
 
@@ -48,3 +49,33 @@ def test_get_db_yields_and_closes():
     # Session closed: new op should open a new connection (no exception thrown)
     # just ensure calling close() twice is safe
     db.close()
+
+
+def test_async_database_url_maps_drivers():
+    from app.db import async_database_url
+    assert async_database_url("postgresql://u:p@db:5432/appdb") == "postgresql+psycopg://u:p@db:5432/appdb"
+    assert async_database_url("postgresql+psycopg2://u:p@db/appdb") == "postgresql+psycopg://u:p@db/appdb"
+    assert async_database_url("sqlite+pysqlite:///:memory:") == "sqlite+aiosqlite:///:memory:"
+
+
+def test_get_async_db_yields_async_session():
+    import asyncio
+    from sqlalchemy import text
+    from sqlalchemy.ext.asyncio import AsyncSession
+    from app.db import get_async_db
+
+    async def _run():
+        gen = get_async_db()
+        db = await gen.__anext__()
+        assert isinstance(db, AsyncSession)
+        assert (await db.execute(text("select 1"))).scalar() == 1
+        await gen.aclose()
+
+    asyncio.run(_run())
+
+
+def test_me_reads_user_through_async_session(client, login_user):
+    user, _ = login_user("async-db@example.com", client=client)
+    res = client.get("/api/auth/me")
+    assert res.status_code == 200
+    assert res.json()["user"] == {"id": user.id, "email": "async-db@example.com", "role_id": None}
@@ -46,3 +46,21 @@ def test_set_redis_override_clears_and_rebuilds(monkeypatch):
     out = rc.get_redis()
     mock_from_url.assert_called_once_with(rc.settings.REDIS_URL, decode_responses=True)
     assert out == "NEW_CLIENT"
+
+def test_get_async_redis_uses_override_and_rebuilds(monkeypatch):
+    import asyncio
+    import fakeredis.aioredis
+    from unittest.mock import MagicMock
+
+    fake = fakeredis.aioredis.FakeRedis(decode_responses=True)
+    rc.set_async_redis_override(fake)
+    assert asyncio.run(rc.get_async_redis()) is fake
+
+    mock_from_url = MagicMock(return_value="NEW_ASYNC_CLIENT")
+    monkeypatch.setattr(rc, "AsyncRedis", type("R", (), {"from_url": staticmethod(mock_from_url)}))
+    rc.set_async_redis_override(None)
+
+    out = asyncio.run(rc.get_async_redis())
+    mock_from_url.assert_called_once_with(rc.settings.REDIS_URL, decode_responses=True)
+    assert out == "NEW_ASYNC_CLIENT"
+    rc._build_async_client.cache_clear()
@@ -0,0 +1,47 @@
+# app/tests/test_session_async.py
+import asyncio
+import fakeredis
+import fakeredis.aioredis
+
+from app.auth.session import (
+    create_session_async,
+    get_current_user_id_async,
+    destroy_session_async,
+    get_current_user_id,
+)
+
+
+def test_async_session_roundtrip():
+    async def _run():
+        r = fakeredis.aioredis.FakeRedis(decode_responses=True)
+        sid = await create_session_async(42, r=r)
+        assert await get_current_user_id_async(r, sid) == 42
+        assert await r.ttl(f"sess:{sid}") > 0
+        await destroy_session_async(sid, r)
+        assert await get_current_user_id_async(r, sid) is None
+
+    asyncio.run(_run())
+
+
+def test_async_get_current_user_id_without_sid():
+    r = fakeredis.aioredis.FakeRedis(decode_responses=True)
+    assert asyncio.run(get_current_user_id_async(r, None)) is None
+    assert asyncio.run(get_current_user_id_async(r, "")) is None
+
+
+def test_async_session_visible_to_sync_client():
+    server = fakeredis.FakeServer()
+    ar = fakeredis.aioredis.FakeRedis(server=server, decode_responses=True)
+    sid = asyncio.run(create_session_async(7, r=ar))
+    sync_r = fakeredis.FakeRedis(server=server, decode_responses=True)
+    assert get_current_user_id(sync_r, sid) == 7
+
+
+def test_whoami_and_logout_use_async_redis(client, login_user, fake_redis):
+    user, sid = login_user("async@example.com", client=client)
+    res = client.get("/api/protected/whoami")
+    assert res.status_code == 200
+    assert res.json() == {"user_id": user.id}
+
+    assert client.post("/api/auth/logout").status_code == 200
+    assert fake_redis.get(f"sess:{sid}") is None
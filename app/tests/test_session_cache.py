@@ -0,0 +1,91 @@
+# app/tests/test_session_cache.py
+import asyncio
+import fakeredis
+import fakeredis.aioredis
+import pytest
+
+from app.auth import session_cache as sc
+from app.auth.session import create_session_async, get_current_user_id_async, destroy_session_async
+
+
+@pytest.fixture
+def cache():
+    c = sc.SessionCache(max_entries=100, ttl_seconds=60)
+    sc.set_session_cache(c)
+    yield c
+    sc.set_session_cache(None)
+
+
+def test_lru_eviction_and_counters():
+    c = sc.SessionCache(max_entries=2, ttl_seconds=60)
+    c.set("a", 1)
+    c.set("b", 2)
+    assert c.get("a") == 1          # "a" is now most recently used
+    c.set("c", 3)                   # evicts "b"
+    assert c.get("b") is None
+    assert c.get("c") == 3
+    stats = c.stats()
+    assert stats["hits"] == 2 and stats["misses"] == 1
+    assert stats["evictions"] == 1 and stats["size"] == 2
+
+
+def test_entries_expire_after_ttl():
+    now = [100.0]
+    c = sc.SessionCache(max_entries=10, ttl_seconds=5, clock=lambda: now[0])
+    c.set("a", 1)
+    now[0] += 4.9
+    assert c.get("a") == 1
+    now[0] += 0.2
+    assert c.get("a") is None
+    assert c.stats()["expirations"] == 1
+
+
+def test_async_lookup_served_from_cache(cache):
+    async def _run():
+        r = fakeredis.aioredis.FakeRedis(decode_responses=True)
+        sid = await create_session_async(5, r=r)
+        assert await get_current_user_id_async(r, sid) == 5   # miss -> redis
+        await r.delete(f"sess:{sid}")                          # bypass destroy_session
+        assert await get_current_user_id_async(r, sid) == 5   # hit, no redis
+        await destroy_session_async(sid, r)
+        assert await get_current_user_id_async(r, sid) is None
+
+    asyncio.run(_run())
+    assert cache.stats()["hits"] == 1
+
+
+def test_destroy_session_invalidates_other_workers(cache):
+    other_worker = sc.SessionCache(max_entries=100, ttl_seconds=60)
+
+    async def _run():
+        server = fakeredis.FakeServer()
+        r = fakeredis.aioredis.FakeRedis(server=server, decode_responses=True)
+        listener = asyncio.create_task(
+            sc.run_invalidation_listener(fakeredis.aioredis.FakeRedis(server=server, decode_responses=True), other_worker)
+        )
+        await asyncio.sleep(0.05)  # let it subscribe
+        other_worker.set("sid-1", 9)
+
+        await destroy_session_async("sid-1", r)
+        for _ in range(100):
+            if other_worker.get("sid-1") is None:
+                break
+            await asyncio.sleep(0.01)
+        listener.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await listener
+
+    asyncio.run(_run())
+    assert other_worker.stats()["invalidations"] == 1
+
+
+def test_session_cache_stats_endpoint(client, cache):
+    cache.set("x", 1)
+    cache.get("x")
+    body = client.get("/api/session-cache").json()
+    assert body["enabled"] is True
+    assert body["stats"]["hits"] == 1 and body["stats"]["size"] == 1
+
+
+def test_session_cache_stats_endpoint_disabled(client):
+    assert client.get("/api/session-cache").json() == {"enabled": False, "stats": None}